@@ -14,6 +14,14 @@ if str(ROOT) not in sys.path:
 from staging.common.services.connection import get_staging_db, get_production_db
 from .validators import DataValidator, DataTransformer
 
+# Officers sent to production per multi-row upsert
+OFFICER_BATCH_SIZE = 1000
+# production_officers' UNIQUE key, which the officer upsert conflicts on
+OFFICER_CONFLICT_COLUMNS = ("company_number", "officer_name", "appointed_on", "officer_role", "date_of_birth")
+# Columns the officer upsert's DO UPDATE SET overwrites on a conflict (date_of_birth
+# is part of the key, so it never differs)
+OFFICER_UPDATE_COLUMNS = ("resigned_on", "nationality", "nature_of_control", "raw_data", "batch_id")
+
 
 class ProductionMerger:
     """Manage merging data from staging to production."""
@@ -103,14 +111,19 @@ class ProductionMerger:
             AND company_name IS NOT NULL
         """
 
-        companies = self.staging_db.execute(query, {"batch_id": self.batch_id}, fetch=True)
-        print(f"  Found {len(companies)} companies to merge")
+        # Streamed from a server-side cursor so the batch is never held in memory
+        companies = self.staging_db.stream(query, {"batch_id": self.batch_id})
 
         if self.dry_run:
-            self.stats["companies_merged"] = len(companies)
+            self.stats["companies_merged"] = sum(1 for _ in companies)
+            print(f"  Found {self.stats['companies_merged']} companies to merge")
             return
 
+        # Counted as the stream is consumed; its length is not known up front
+        found = 0
         for company in companies:
+            found += 1
+
             # Calculate quality score
             quality_score = DataTransformer.calculate_company_quality_score(company)
 
@@ -252,6 +265,7 @@ class ProductionMerger:
             else:
                 self.stats["companies_updated"] += 1
 
+        print(f"  Found {found} companies to merge")
         print(f"  ✓ Merged {self.stats['companies_merged']} new companies")
         print(f"  ✓ Updated {self.stats['companies_updated']} existing companies")
 
@@ -268,87 +282,109 @@ class ProductionMerger:
             AND so.officer_name IS NOT NULL
         """
 
-        officers = self.staging_db.execute(query, {"batch_id": self.batch_id}, fetch=True)
-        print(f"  Found {len(officers)} officers to merge")
+        officers = self.staging_db.stream(query, {"batch_id": self.batch_id})
 
         if self.dry_run:
-            self.stats["officers_merged"] = len(officers)
+            self.stats["officers_merged"] = sum(1 for _ in officers)
+            print(f"  Found {self.stats['officers_merged']} officers to merge")
             return
 
+        # Upsert officers in batches: one multi-row statement per OFFICER_BATCH_SIZE
+        # rows instead of a round trip per officer
+        upsert_query = """
+            INSERT INTO production_officers (
+                company_number,
+                officer_name,
+                officer_role,
+                appointed_on,
+                resigned_on,
+                nationality,
+                nature_of_control,
+                date_of_birth,
+                address_line_1,
+                address_line_2,
+                locality,
+                postal_code,
+                country,
+                raw_data,
+                source_batch_id,
+                first_seen,
+                last_updated
+            ) VALUES %s
+            ON CONFLICT (company_number, officer_name, appointed_on, officer_role, date_of_birth) DO UPDATE SET
+                resigned_on = EXCLUDED.resigned_on,
+                nationality = EXCLUDED.nationality,
+                nature_of_control = EXCLUDED.nature_of_control,
+                date_of_birth = EXCLUDED.date_of_birth,
+                raw_data = EXCLUDED.raw_data,
+                source_batch_id = EXCLUDED.source_batch_id,
+                last_updated = NOW()
+        """
+        row_template = """(
+            %(company_number)s,
+            %(officer_name)s,
+            %(officer_role)s,
+            %(appointed_on)s,
+            %(resigned_on)s,
+            %(nationality)s,
+            %(nature_of_control)s,
+            %(date_of_birth)s,
+            %(address_line_1)s,
+            %(address_line_2)s,
+            %(locality)s,
+            %(postal_code)s,
+            %(country)s,
+            %(raw_data)s,
+            %(batch_id)s,
+            NOW(),
+            NOW()
+        )"""
+
+        batch = {}
+        found = 0
         for officer in officers:
+            found += 1
+            row = {
+                "company_number": officer["company_number"],
+                "officer_name": officer["officer_name"],
+                "officer_role": officer["officer_role"] or "unknown",
+                "appointed_on": officer["appointed_on"],
+                "resigned_on": officer["resigned_on"],
+                "nationality": officer["nationality"],
+                "nature_of_control": officer.get("nature_of_control"),
+                "date_of_birth": officer.get("date_of_birth"),
+                "address_line_1": officer["address_line_1"],
+                "address_line_2": officer["address_line_2"],
+                "locality": officer["locality"],
+                "postal_code": officer["postal_code"],
+                "country": officer["country"],
+                "raw_data": officer["raw_data"],
+                "batch_id": self.batch_id,
+            }
+
+            # A single INSERT ... ON CONFLICT cannot update the same row twice, so
+            # repeats of an officer are folded into one row the way consecutive
+            # upserts would have left it: the first occurrence's inserted columns
+            # (address, first_seen) with the updated columns from the last one.
+            # Keys containing NULL never conflict and are all kept.
+            key = tuple(row[column] for column in OFFICER_CONFLICT_COLUMNS)
+            if None in key:
+                batch[object()] = row
+            elif key in batch:
+                batch[key].update((column, row[column]) for column in OFFICER_UPDATE_COLUMNS)
+            else:
+                batch[key] = row
 
-            # Upsert officer
-            upsert_query = """
-                INSERT INTO production_officers (
-                    company_number,
-                    officer_name,
-                    officer_role,
-                    appointed_on,
-                    resigned_on,
-                    nationality,
-                    nature_of_control,
-                    date_of_birth,
-                    address_line_1,
-                    address_line_2,
-                    locality,
-                    postal_code,
-                    country,
-                    raw_data,
-                    source_batch_id,
-                    first_seen,
-                    last_updated
-                ) VALUES (
-                    %(company_number)s,
-                    %(officer_name)s,
-                    %(officer_role)s,
-                    %(appointed_on)s,
-                    %(resigned_on)s,
-                    %(nationality)s,
-                    %(nature_of_control)s,
-                    %(date_of_birth)s,
-                    %(address_line_1)s,
-                    %(address_line_2)s,
-                    %(locality)s,
-                    %(postal_code)s,
-                    %(country)s,
-                    %(raw_data)s,
-                    %(batch_id)s,
-                    NOW(),
-                    NOW()
-                )
-                ON CONFLICT (company_number, officer_name, appointed_on, officer_role, date_of_birth) DO UPDATE SET
-                    resigned_on = EXCLUDED.resigned_on,
-                    nationality = EXCLUDED.nationality,
-                    nature_of_control = EXCLUDED.nature_of_control,
-                    date_of_birth = EXCLUDED.date_of_birth,
-                    raw_data = EXCLUDED.raw_data,
-                    source_batch_id = EXCLUDED.source_batch_id,
-                    last_updated = NOW()
-            """
+            self.stats["officers_merged"] += 1
 
-            self.production_db.execute(
-                upsert_query,
-                {
-                    "company_number": officer["company_number"],
-                    "officer_name": officer["officer_name"],
-                    "officer_role": officer["officer_role"] or "unknown",
-                    "appointed_on": officer["appointed_on"],
-                    "resigned_on": officer["resigned_on"],
-                    "nationality": officer["nationality"],
-                    "nature_of_control": officer.get("nature_of_control"),
-                    "date_of_birth": officer.get("date_of_birth"),
-                    "address_line_1": officer["address_line_1"],
-                    "address_line_2": officer["address_line_2"],
-                    "locality": officer["locality"],
-                    "postal_code": officer["postal_code"],
-                    "country": officer["country"],
-                    "raw_data": officer["raw_data"],
-                    "batch_id": self.batch_id,
-                },
-            )
+            if len(batch) >= OFFICER_BATCH_SIZE:
+                self.production_db.execute_values(upsert_query, list(batch.values()), template=row_template)
+                batch = {}
 
-            self.stats["officers_merged"] += 1
+        if batch:
+            self.production_db.execute_values(upsert_query, list(batch.values()), template=row_template)
 
+        print(f"  Found {found} officers to merge")
         print(f"  ✓ Merged {self.stats['officers_merged']} officers")
 
     def _merge_financials(self) -> None:
@@ -363,17 +399,17 @@ class ProductionMerger:
             AND sc.needs_review = false
         """
 
-        financials = self.staging_db.execute(query, {"batch_id": self.batch_id}, fetch=True)
-        print(f"  Found {len(financials)} financial records to merge")
-
-        if len(financials) == 0:
-            return
+        financials = self.staging_db.stream(query, {"batch_id": self.batch_id})
 
         if self.dry_run:
-            self.stats["financials_merged"] = len(financials)
+            self.stats["financials_merged"] = sum(1 for _ in financials)
+            print(f"  Found {self.stats['financials_merged']} financial records to merge")
             return
 
+        found = 0
         for financial in financials:
+            found += 1
+
             # Upsert financial record
             upsert_query = """
                 INSERT INTO production_financials (
@@ -432,6 +468,7 @@ class ProductionMerger:
 
             self.stats["financials_merged"] += 1
 
+        print(f"  Found {found} financial records to merge")
         print(f"  ✓ Merged {self.stats['financials_merged']} financial records")
 
     def _log_merge(self) -> None:
@@ -4,7 +4,10 @@ Provides common ZIP/CSV handling with chunked reading for memory efficiency.
 """
 from __future__ import annotations
 
+import csv
 import hashlib
+import io
+import warnings
 from abc import ABC, abstractmethod
 from pathlib import Path
 from typing import Iterator, Any
@@ -12,6 +15,52 @@ from zipfile import ZipFile
 
 import pandas as pd
 
+try:
+    import pyarrow as pa
+    import pyarrow.csv as pa_csv
+except ImportError:
+    pa = None
+    pa_csv = None
+
+# pandas' default NA markers, so the pyarrow reader nulls the same cells read_csv does
+CSV_NA_VALUES = [
+    '', '#N/A', '#N/A N/A', '#NA', '-1.#IND', '-1.#QNAN', '-NaN', '-nan',
+    '1.#IND', '1.#QNAN', '<NA>', 'N/A', 'NA', 'NULL', 'NaN', 'None', 'n/a', 'nan', 'null',
+]
+
+
+def hash_strings(column: pd.Series) -> list[str]:
+    """
+    Normalise one column's cells for the change detection hash.
+
+    Missing cells (None, NaN, NaT) become '' and everything else is str()'d.
+    They are found with one vectorised isna() rather than pd.isna per cell;
+    list/dict cells are never NA there, so they are str()'d too.
+    """
+    return ['' if missing else str(val) for val, missing in zip(column.tolist(), column.isna().tolist())]
+
+
+def compute_hashes(df: pd.DataFrame, fields: list[str]) -> list[str]:
+    """
+    Compute the change detection hash for every row of a DataFrame.
+
+    Each hash column is converted to strings in one pass (hash_strings) and
+    rows are joined from those lists, so nothing is built per row besides the
+    hash string itself. Fields missing from df hash as ''.
+
+    Args:
+        df: DataFrame to hash
+        fields: Columns to hash, in order
+
+    Returns:
+        List of MD5 hash strings aligned with df's rows
+    """
+    columns = [
+        hash_strings(df[field]) if field in df.columns else [''] * len(df)
+        for field in fields
+    ]
+    return [hashlib.md5('|'.join(values).encode('utf-8')).hexdigest() for values in zip(*columns)]
+
 
 class BulkDataParser(ABC):
     """
@@ -26,7 +75,9 @@ class BulkDataParser(ABC):
     FIELD_MAPPINGS: dict[str, str] = {}
     TARGET_TABLE: str = 'staging_companies'
     HASH_FIELDS: list[str] = []
-    CHUNK_SIZE: int = 100_000  # Rows per chunk
+    CHUNK_SIZE: int = 100_000  # Rows per chunk (pandas reader)
+    CSV_BLOCK_SIZE: int = 64 << 20  # Bytes per batch (pyarrow reader)
+    READ_BUFFER_SIZE: int = 1 << 20  # Decompressed bytes buffered per read (pandas reader)
 
     def __init__(self, file_path: Path):
         """
@@ -56,33 +107,132 @@ class BulkDataParser(ABC):
             if not csv_filename:
                 raise ValueError(f"No CSV file found in {self.file_path}")
 
-            with archive.open(csv_filename) as csv_file:
+            for chunk in self._read_csv_chunks(archive, csv_filename):
+                # Clean column names
+                chunk.columns = chunk.columns.str.strip()
+
+                # Apply field mappings
+                normalized = self.normalize_columns(chunk)
+
+                # Apply any custom transformations
+                transformed = self.transform(normalized)
+
+                # Compute data hash for change detection
+                if self.HASH_FIELDS:
+                    transformed['data_hash'] = compute_hashes(transformed, self.HASH_FIELDS)
+
+                yield transformed
+
+    def _read_csv_chunks(self, archive: ZipFile, csv_filename: str) -> Iterator[pd.DataFrame]:
+        """
+        Read the CSV member in string-typed chunks.
+
+        Uses pyarrow's streaming CSV reader when it is installed (multi-threaded
+        parsing straight into Arrow string arrays), otherwise pandas' chunked
+        read_csv. Malformed lines are treated as read_csv treats them: lines
+        with too many fields are skipped with a ParserWarning, lines with too
+        few are kept and padded with nulls (yielded after the last batch).
+
+        Args:
+            archive: Open ZIP archive
+            csv_filename: Name of the CSV member
+
+        Yields:
+            pd.DataFrame: Raw chunks with the original column names
+        """
+        if pa_csv is None:
+            # No usecols here: with it, read_csv stops rejecting over-long rows
+            # and loads them with shifted fields. normalize_columns() projects.
+            with archive.open(csv_filename) as member:
+                # Decompress in large blocks rather than per parser read
+                csv_file = io.BufferedReader(member, buffer_size=self.READ_BUFFER_SIZE)
                 # Use chunked reading for memory efficiency
-                chunk_iter = pd.read_csv(
+                yield from pd.read_csv(
                     csv_file,
                     chunksize=self.CHUNK_SIZE,
                     dtype=str,  # Read all as strings initially
                     low_memory=False,
                     on_bad_lines='warn'
                 )
+            return
+
+        # Only parse the columns normalize_columns() will keep. Header names
+        # can carry stray whitespace, so match on the stripped name.
+        wanted = set(self.FIELD_MAPPINGS)
+
+        # Column names are needed up front to type every column as a string
+        with archive.open(csv_filename) as csv_file:
+            header = list(pd.read_csv(csv_file, nrows=0).columns)
+        columns = [col for col in header if not wanted or col.strip() in wanted]
+
+        short_rows: list[str] = []
+
+        def handle_invalid_row(row: Any) -> str:
+            # pyarrow can only skip or fail a row; keep short rows' text so
+            # they can be padded afterwards, as read_csv does
+            if row.actual_columns < row.expected_columns:
+                short_rows.append(row.text)
+            else:
+                self._warn_bad_row(row)
+            return 'skip'
+
+        with archive.open(csv_filename) as csv_file:
+            reader = pa_csv.open_csv(
+                csv_file,
+                read_options=pa_csv.ReadOptions(block_size=self.CSV_BLOCK_SIZE),
+                parse_options=pa_csv.ParseOptions(
+                    newlines_in_values=True,
+                    invalid_row_handler=handle_invalid_row,
+                ),
+                convert_options=pa_csv.ConvertOptions(
+                    column_types={col: pa.string() for col in columns},
+                    include_columns=columns,
+                    strings_can_be_null=True,
+                    null_values=CSV_NA_VALUES,
+                ),
+            )
+            for batch in reader:
+                # One block per column and free the Arrow buffers as they are
+                # converted, so a batch is never held twice in memory
+                yield batch.to_pandas(split_blocks=True, self_destruct=True)
+
+        if short_rows:
+            yield self._pad_short_rows(short_rows, header, columns)
+
+    @staticmethod
+    def _warn_bad_row(row: Any) -> None:
+        """Warn about a skipped row the way on_bad_lines='warn' does."""
+        # Line numbers are not tracked when values may contain newlines
+        where = f"line {row.number}" if row.number is not None else repr(row.text[:80])
+        warnings.warn(
+            f"Skipping {where}: expected {row.expected_columns} fields, saw {row.actual_columns}",
+            pd.errors.ParserWarning,
+            stacklevel=2,
+        )
+
+    @staticmethod
+    def _pad_short_rows(texts: list[str], header: list[str], columns: list[str]) -> pd.DataFrame:
+        """
+        Parse rows with too few fields, padding the missing trailing fields with nulls.
 
-                for chunk in chunk_iter:
-                    # Clean column names
-                    chunk.columns = chunk.columns.str.strip()
-
-                    # Apply field mappings
-                    normalized = self.normalize_columns(chunk)
-
-                    # Apply any custom transformations
-                    transformed = self.transform(normalized)
-
-                    # Compute data hash for change detection
-                    if self.HASH_FIELDS:
-                        transformed['data_hash'] = transformed.apply(
-                            self._compute_row_hash, axis=1
-                        )
+        Args:
+            texts: Raw CSV text of each short row
+            header: Column names of the whole file, in order
+            columns: Columns to keep, as read by the pyarrow reader
 
-                    yield transformed
+        Returns:
+            pd.DataFrame: The rows, string-typed like the other chunks
+        """
+        na_values = set(CSV_NA_VALUES)
+        rows = []
+        for text in texts:
+            for fields in csv.reader(io.StringIO(text)):
+                values = dict(zip(header, fields))
+                rows.append([
+                    value if value is not None and value not in na_values else None
+                    for value in map(values.get, columns)
+                ])
+        return pd.DataFrame(rows, columns=columns, dtype=str)
 
     def _find_csv_in_archive(self, archive: ZipFile) -> str | None:
         """Find the first CSV file in the ZIP archive."""
@@ -107,8 +257,13 @@ class BulkDataParser(ABC):
             if src in df.columns
         }
 
-        # Select and rename only the mapped columns
-        result = df[list(available_mappings.keys())].rename(columns=available_mappings)
+        # Select only the mapped columns. Column selection already builds a new
+        # frame, so relabel a shallow copy of it rather than via rename(), which
+        # copies the whole chunk a second time. The explicit copy also detaches
+        # the selection from df, so transform() can assign columns without
+        # SettingWithCopyWarning.
+        result = df[list(available_mappings.keys())].copy(deep=False)
+        result.columns = list(available_mappings.values())
 
         return result
 
@@ -125,30 +280,6 @@ class BulkDataParser(ABC):
         """
         return df
 
-    def _compute_row_hash(self, row: pd.Series) -> str:
-        """
-        Compute MD5 hash of specified fields for change detection.
-
-        Args:
-            row: A single row from the DataFrame
-
-        Returns:
-            MD5 hash string (32 characters)
-        """
-        values = []
-        for field in self.HASH_FIELDS:
-            val = row.get(field, '')
-            # Handle list/dict types first (since they cause pd.isna to fail)
-            if isinstance(val, (list, dict)):
-                val = str(val)
-            # Handle NaN and None
-            elif pd.isna(val):
-                val = ''
-            values.append(str(val))
-
-        hash_string = '|'.join(values)
-        return hashlib.md5(hash_string.encode('utf-8')).hexdigest()
-
     @classmethod
     def compute_hash(cls, data: dict[str, Any]) -> str:
         """
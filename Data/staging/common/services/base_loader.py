@@ -3,9 +3,16 @@ Base loader service for PostgreSQL.
 """
 from __future__ import annotations
 
+import json
 import sys
 from pathlib import Path
 from abc import ABC
+from typing import Any
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
 # Add Data root to path
 # Data/staging/common/services/base_loader.py -> parents[3] should be Data/
@@ -17,6 +24,19 @@ if str(DATA_ROOT) not in sys.path:
 # It is at Data/database.
 from staging.common.services.connection import get_staging_db
 
+
+def dumps_json(value: Any) -> str:
+    """
+    Serialise a value to compact JSON text for COPY payloads.
+
+    Uses orjson when installed (several times faster than the stdlib encoder),
+    falling back to json.dumps with the same compact separators.
+    """
+    if orjson is not None:
+        return orjson.dumps(value).decode('utf-8')
+    return json.dumps(value, separators=(',', ':'))
+
+
 class BaseLoader(ABC):
     """
     Base class for bulk loaders.
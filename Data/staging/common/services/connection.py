@@ -4,14 +4,15 @@ Database connection management for staging and production databases.
 from __future__ import annotations
 
 import os
+import uuid
 from contextlib import contextmanager
-from typing import Generator
+from typing import Generator, Iterator
 from pathlib import Path
 
 import json
 import psycopg2
 from psycopg2 import pool
-from psycopg2.extras import RealDictCursor, Json
+from psycopg2.extras import RealDictCursor, Json, execute_values
 from psycopg2.extensions import register_adapter
 from dotenv import load_dotenv
 
@@ -144,6 +145,35 @@ class DatabaseManager:
                 return cur.fetchall()
             return None
 
+    def stream(
+        self, query: str, params: tuple | dict | None = None, itersize: int = 10_000
+    ) -> Iterator[dict]:
+        """
+        Execute a query on a server-side cursor and yield rows as dicts.
+
+        Rows are fetched from the server in batches of itersize, so large result
+        sets are never held in memory at once. The connection stays checked out
+        until the iterator is exhausted or closed.
+
+        Args:
+            query: SQL query to execute
+            params: Query parameters (tuple or dict)
+            itersize: Rows fetched per network round trip
+
+        Yields:
+            Result rows as dicts
+        """
+        with self.get_connection() as conn:
+            cursor = conn.cursor(name=f"stream_{uuid.uuid4().hex}", cursor_factory=RealDictCursor)
+            try:
+                cursor.itersize = itersize
+                cursor.execute(query, params)
+                yield from cursor
+            finally:
+                cursor.close()
+                # Read-only: end the transaction the named cursor ran in
+                conn.rollback()
+
     def execute_many(self, query: str, params_list: list[tuple | dict]) -> None:
         """
         Execute the same query with multiple parameter sets.
@@ -155,6 +185,21 @@ class DatabaseManager:
         with self.get_cursor(dict_cursor=False) as cur:
             cur.executemany(query, params_list)
 
+    def execute_values(
+        self, query: str, params_list: list[tuple | dict], template: str | None = None, page_size: int = 1000
+    ) -> None:
+        """
+        Execute a multi-row statement, sending page_size rows per round trip.
+
+        Args:
+            query: SQL query with a single VALUES %s placeholder
+            params_list: List of parameter tuples/dicts, one per row
+            template: Row template (required for dict rows, e.g. "(%(a)s, %(b)s)")
+            page_size: Rows per generated statement
+        """
+        with self.get_cursor(dict_cursor=False) as cur:
+            execute_values(cur, query, params_list, template=template, page_size=page_size)
+
     def close(self) -> None:
         """Close all connections in the pool."""
         if self.pool:
@@ -13,6 +13,8 @@ from threading import Lock
 
 import requests
 
+from .http_session import create_session
+
 
 @dataclass
 class DownloadProgress:
@@ -53,7 +55,7 @@ class DownloadManager:
     - Resume support (not implemented yet, but designed for it)
     """
 
-    CHUNK_SIZE = 8192  # 8KB chunks
+    CHUNK_SIZE = 1 << 20  # 1 MiB per read/write; bulk archives run to several GB
 
     def __init__(
         self,
@@ -72,7 +74,7 @@ class DownloadManager:
         self.download_dir = Path(download_dir) if download_dir else Path(tempfile.mkdtemp())
         self.download_dir.mkdir(parents=True, exist_ok=True)
         self.max_workers = max_workers
-        self.session = session or requests.Session()
+        self.session = session or create_session(pool_maxsize=max_workers)
         self._progress: dict[str, DownloadProgress] = {}
         self._lock = Lock()
         self._executor: Optional[ThreadPoolExecutor] = None
@@ -104,25 +106,26 @@ class DownloadManager:
         self._progress[url] = progress
 
         try:
-            # Make request with streaming
-            response = self.session.get(url, stream=True, timeout=60)
-            response.raise_for_status()
-
-            # Get total size if available
-            total_size = int(response.headers.get('content-length', 0))
-            progress.total_bytes = total_size
-
-            # Download with progress tracking
-            downloaded = 0
-            with open(local_path, 'wb') as f:
-                for chunk in response.iter_content(chunk_size=self.CHUNK_SIZE):
-                    if chunk:
-                        f.write(chunk)
-                        downloaded += len(chunk)
-                        progress.downloaded_bytes = downloaded
-
-                        if progress_callback:
-                            progress_callback(progress)
+            # Make request with streaming; the context manager returns the
+            # connection to the pool even if the body is not fully read
+            with self.session.get(url, stream=True, timeout=60) as response:
+                response.raise_for_status()
+
+                # Get total size if available
+                total_size = int(response.headers.get('content-length', 0))
+                progress.total_bytes = total_size
+
+                # Download with progress tracking
+                downloaded = 0
+                with open(local_path, 'wb') as f:
+                    for chunk in response.iter_content(chunk_size=self.CHUNK_SIZE):
+                        if chunk:
+                            f.write(chunk)
+                            downloaded += len(chunk)
+                            progress.downloaded_bytes = downloaded
+
+                            if progress_callback:
+                                progress_callback(progress)
 
             progress.status = 'completed'
             progress.local_path = local_path
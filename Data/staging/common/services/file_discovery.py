@@ -15,6 +15,8 @@ from functools import lru_cache
 import requests
 from bs4 import BeautifulSoup
 
+from .http_session import create_session
+
 
 @dataclass
 class AvailableFile:
@@ -57,6 +59,7 @@ class FileDiscoveryService:
     """
 
     BASE_URL = 'http://download.companieshouse.gov.uk'
+    POOL_MAXSIZE = 4  # Connections kept open to BASE_URL's host
 
     PRODUCT_PAGES = {
         'company': ['/en_output.html'],
@@ -93,7 +96,7 @@ class FileDiscoveryService:
         Args:
             session: Optional requests session for connection pooling
         """
-        self.session = session or requests.Session()
+        self.session = session or create_session(pool_maxsize=self.POOL_MAXSIZE)
         self._cache: dict[str, list[AvailableFile]] = {}
 
     def discover_files(
@@ -130,16 +133,22 @@ class FileDiscoveryService:
 
         # Accounts specific logic: Prefer Monthly Archives over Daily files
         if product == 'accounts':
-            archives = [f for f in filtered if f.is_monthly_archive]
-            dailies = [f for f in filtered if not f.is_monthly_archive]
+            # Split and find the latest archive date in a single pass
+            archives = []
+            dailies = []
+            latest_archive_start = None
+            for f in filtered:
+                if f.is_monthly_archive:
+                    archives.append(f)
+                    if latest_archive_start is None or f.file_date > latest_archive_start:
+                        latest_archive_start = f.file_date
+                else:
+                    dailies.append(f)
             
             # Find the coverage of the latest archive
             latest_archive_end_date = date.min
-            if archives:
+            if latest_archive_start is not None:
                 # Assuming archive date is 1st of month, it covers the whole month
-                # Find the latest archive date
-                latest_archive_start = max(f.file_date for f in archives)
-                
                 # Calculate end of that month
                 if latest_archive_start.month == 12:
                     latest_archive_end_date = date(latest_archive_start.year, 12, 31)
@@ -253,7 +262,7 @@ class FileDiscoveryService:
         if product == 'company':
             match = self.COMPANY_PATTERN.search(url)
             if match:
-                file_date = datetime.strptime(match.group(1), '%Y-%m-%d').date()
+                file_date = date.fromisoformat(match.group(1))
                 return AvailableFile(
                     product='company',
                     url=url,
@@ -265,7 +274,7 @@ class FileDiscoveryService:
         elif product == 'psc':
             match = self.PSC_PATTERN.search(url)
             if match:
-                file_date = datetime.strptime(match.group(1), '%Y-%m-%d').date()
+                file_date = date.fromisoformat(match.group(1))
                 return AvailableFile(
                     product='psc',
                     url=url,
@@ -278,7 +287,7 @@ class FileDiscoveryService:
             # Check for daily file pattern
             match = self.ACCOUNTS_PATTERN.search(url)
             if match:
-                file_date = datetime.strptime(match.group(1), '%Y-%m-%d').date()
+                file_date = date.fromisoformat(match.group(1))
                 return AvailableFile(
                     product='accounts',
                     url=url,
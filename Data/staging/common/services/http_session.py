@@ -0,0 +1,35 @@
+"""
+Shared requests session setup for talking to Companies House.
+"""
+from __future__ import annotations
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+
+def create_session(pool_maxsize: int) -> requests.Session:
+    """
+    Create a keep-alive session with retries on transient errors.
+
+    Everything is fetched from the one Companies House host, so the adapter
+    caches a single connection pool holding up to pool_maxsize connections.
+
+    Args:
+        pool_maxsize: Connections kept open to the host (one per concurrent caller)
+
+    Returns:
+        Configured requests session
+    """
+    session = requests.Session()
+    retry = Retry(
+        total=3,
+        backoff_factor=0.5,
+        status_forcelist=[429, 500, 502, 503, 504],
+        allowed_methods=['GET', 'HEAD'],
+        respect_retry_after_header=True,
+    )
+    adapter = HTTPAdapter(pool_connections=1, pool_maxsize=pool_maxsize, max_retries=retry)
+    session.mount('https://', adapter)
+    session.mount('http://', adapter)
+    return session
@@ -4,9 +4,11 @@ Ingestion worker for background processing with stop/resume capability.
 from __future__ import annotations
 
 import json
+import os
 import sys
 import threading
 import time
+import traceback
 import uuid
 from dataclasses import dataclass, field
 from datetime import datetime
@@ -16,6 +18,7 @@ from typing import Callable, Optional, Any
 
 import multiprocessing
 import signal
+from psycopg2.extras import Json
 from staging.common.services.connection import get_staging_db
 from .download_manager import DownloadManager
 from staging.tables.companies.services.loader import CompanyLoader
@@ -25,6 +28,9 @@ from staging.tables.companies.parsers.company_parser import CompanyDataParser
 from staging.tables.psc.parsers.psc_parser import PSCDataParser
 from staging.tables.accounts.parsers.accounts_parser import AccountsDataParser
 
+# Seconds between stop-flag checks while waiting on pool results
+STOP_POLL_INTERVAL = 1.0
+
 
 def _process_file_task(args: tuple) -> dict:
     """
@@ -103,7 +109,11 @@ def _process_file_task(args: tuple) -> dict:
             elif product == 'accounts':
                 # Pass log function adapter if parser supports it
                 # AccountsDataParser expects log_callback
-                parser = AccountsDataParser(local_path, log_callback=lambda m: log(m))
+                parser = AccountsDataParser(
+                    local_path,
+                    log_callback=lambda m: log(m),
+                    parse_cache_path=os.getenv('ACCOUNTS_PARSE_CACHE'),
+                )
                 total_stats = {'inserted': 0}
                 for chunk in parser.parse_chunks():
                     chunk_stats = loader.load_financials(chunk)
@@ -126,7 +136,6 @@ def _process_file_task(args: tuple) -> dict:
 
     except Exception as e:
         log(f"! Error processing file: {e}")
-        import traceback
         log(traceback.format_exc())
         return {
             'file_index': file_index,
@@ -396,12 +405,20 @@ class IngestionWorker:
                 
                 cursor = pool.imap_unordered(_process_file_task, tasks)
                 
-                # Iterate through results
-                for result in cursor:
+                # Iterate through results, polling so a stop request short-circuits
+                # the remaining work instead of waiting for the next file to finish
+                while True:
                     if self._should_stop.is_set():
                         self._log("Stop signal received - terminating pool")
                         pool.terminate()
                         break
+
+                    try:
+                        result = cursor.next(timeout=STOP_POLL_INTERVAL)
+                    except multiprocessing.TimeoutError:
+                        continue
+                    except StopIteration:
+                        break
                     
                     file_index = result['file_index']
                     status = result['status']
@@ -450,7 +467,6 @@ class IngestionWorker:
             self._progress.error = str(e)
             self._update_batch_status(batch_id, 'failed', str(e))
             self._log(f"Batch {batch_id} failed: {e}")
-            import traceback
             self._log(traceback.format_exc())
 
         finally:
@@ -475,7 +491,6 @@ class IngestionWorker:
                 %(batch_id)s, %(search_name)s, 'running', %(files_total)s, %(metadata)s
             )
         """
-        from psycopg2.extras import Json
         self.db.execute(query, {
             'batch_id': batch_id,
             'search_name': 'bulk_ingestion',
@@ -518,7 +533,6 @@ class IngestionWorker:
                 status = 'paused'
             WHERE batch_id = %(batch_id)s
         """
-        from psycopg2.extras import Json
         self.db.execute(query, {
             'batch_id': batch_id,
             'metadata': Json({
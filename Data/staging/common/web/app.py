@@ -362,21 +362,16 @@ def get_status():
     try:
         db = get_staging_db()
 
-        # Get counts
-        company_count = db.execute(
-            "SELECT COUNT(*) as count FROM staging_companies",
-            fetch=True
-        )[0]['count']
-
-        officer_count = db.execute(
-            "SELECT COUNT(*) as count FROM staging_officers",
-            fetch=True
-        )[0]['count']
-
-        financial_count = db.execute(
-            "SELECT COUNT(*) as count FROM staging_financials",
-            fetch=True
-        )[0]['count']
+        # Get counts (one round trip for all three tables)
+        counts = db.execute("""
+            SELECT
+                (SELECT COUNT(*) FROM staging_companies) as company_count,
+                (SELECT COUNT(*) FROM staging_officers) as officer_count,
+                (SELECT COUNT(*) FROM staging_financials) as financial_count
+        """, fetch=True)[0]
+        company_count = counts['company_count']
+        officer_count = counts['officer_count']
+        financial_count = counts['financial_count']
 
         # Get latest batch
         latest_batch = db.execute("""
@@ -7,46 +7,115 @@ Each ZIP contains multiple account files organized by company.
 from __future__ import annotations
 
 import hashlib
+import io
+import multiprocessing
 import re
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
-from typing import Iterator, Any, Optional, Callable, Dict, List
+from typing import BinaryIO, Iterator, Any, Optional, Callable, Dict, List
 from zipfile import ZipFile
-from xml.etree import ElementTree as ET
-from datetime import datetime
+from datetime import date, datetime
 import dateutil.parser
 
 import pandas as pd
+from lxml import etree
+
+# Directory holding this parser and its tag files (tag_dictionary.json, accounts_tags/)
+PARSER_DIR = Path(__file__).resolve().parent
 
 # Import TagManager
 try:
-    from .tag_manager import TagManager
+    from .tag_manager import TagManager, local_key
+    from .parse_cache import ParseCache
 except ImportError:
     # Handle case where run from different context
     import sys
-    sys.path.append(str(Path(__file__).parent))
-    from tag_manager import TagManager
+    sys.path.append(str(PARSER_DIR))
+    from tag_manager import TagManager, local_key
+    from parse_cache import ParseCache
+
+try:
+    from staging.common.parsers.base_parser import compute_hashes
+except ImportError:
+    # Standalone runs: put the Data root on the path, as the loaders do
+    import sys
+    sys.path.append(str(PARSER_DIR.parents[3]))
+    from staging.common.parsers.base_parser import compute_hashes
 
 
 # Regex patterns for iXBRL parsing (flexible namespace prefixes and attribute order)
-# Pattern 1: name before contextRef
-IX_NONFRACTION_RE_1 = re.compile(
-    r"<(?:\w+:)?nonFraction[^>]*?name=[\"'](?P<name>[^\"']+)[\"'][^>]*?contextRef=[\"'](?P<context>[^\"']+)[\"'][^>]*?>(?P<value>.*?)</(?:\w+:)?nonFraction>",
-    re.IGNORECASE | re.DOTALL,
-)
-# Pattern 2: contextRef before name
-IX_NONFRACTION_RE_2 = re.compile(
-    r"<(?:\w+:)?nonFraction[^>]*?contextRef=[\"'](?P<context>[^\"']+)[\"'][^>]*?name=[\"'](?P<name>[^\"']+)[\"'][^>]*?>(?P<value>.*?)</(?:\w+:)?nonFraction>",
-    re.IGNORECASE | re.DOTALL,
-)
-# Pattern 3: Also try nonNumeric for text values (like dates/descriptions)
-IX_NONNUMERIC_RE = re.compile(
-    r"<(?:\w+:)?nonNumeric[^>]*?name=[\"'](?P<name>[^\"']+)[\"'][^>]*?contextRef=[\"'](?P<context>[^\"']+)[\"'][^>]*?>(?P<value>.*?)</(?:\w+:)?nonNumeric>",
-    re.IGNORECASE | re.DOTALL,
+# Opening tag of a numeric (nonFraction) or text (nonNumeric, e.g. dates) fact;
+# one scan finds both kinds
+IX_FACT_OPEN_RE = re.compile(
+    r"<(?:\w+:)?(?P<kind>nonFraction|nonNumeric)(?P<attrs>[^>]*)>",
+    re.IGNORECASE,
 )
+# name / contextRef attributes of a fact's opening tag, in either order
+IX_NAME_ATTR_RE = re.compile(r"\bname=[\"']([^\"']+)[\"']", re.IGNORECASE)
+IX_CONTEXT_ATTR_RE = re.compile(r"\bcontextRef=[\"']([^\"']+)[\"']", re.IGNORECASE)
+# End of a fact's value: the first matching closing tag after the opening one
+IX_FACT_CLOSE_RES = {
+    'nonfraction': re.compile(r"</(?:\w+:)?nonFraction>", re.IGNORECASE),
+    'nonnumeric': re.compile(r"</(?:\w+:)?nonNumeric>", re.IGNORECASE),
+}
 IX_CONTEXT_RE = re.compile(
     r"<(?:\w+:)?context[^>]*?id=[\"'](?P<id>[^\"']+)[\"'][^>]*?>.*?(?:<(?:\w+:)?(?:endDate|instant)>(?P<end>[^<]+)</(?:\w+:)?(?:endDate|instant)>).*?</(?:\w+:)?context>",
     re.IGNORECASE | re.DOTALL,
 )
+IX_IDENTIFIER_RE = re.compile(
+    r'<(?:xbrli:)?identifier[^>]*>([^<]+)</(?:xbrli:)?identifier>',
+    re.IGNORECASE
+)
+# Markup nested inside a matched fact value (e.g. <span> formatting). A negated
+# class matches the same spans as a lazy '<.*?>' without backtracking per char.
+IX_TAG_STRIP_RE = re.compile(r'<[^>]*>')
+
+# Numeric fact values: separators stripped via translate, then a pattern check
+# so non-numeric text is rejected without raising from float()
+NUMBER_RE = re.compile(r'\s*[-+]?(?:\d+\.?\d*|\.\d+)(?:[eE][-+]?\d+)?\s*')
+XBRL_NUMBER_STRIP = str.maketrans('', '', ',')
+# iXBRL display values also use spaces / non-breaking spaces as thousands separators
+IXBRL_NUMBER_STRIP = str.maketrans('', '', ', \xa0')
+
+# lxml handles for iXBRL (XHTML). recover lets slightly malformed filings through;
+# entity resolution stays off for untrusted input.
+IXBRL_XML_PARSER = etree.XMLParser(recover=True, huge_tree=True, resolve_entities=False)
+# Elements read from an iXBRL tree, in any (or no) namespace; collected in one iter() walk
+IX_TREE_TAGS = ('{*}nonFraction', '{*}nonNumeric', '{*}context', '{*}identifier')
+# Compiled once; evaluating a prepared XPath skips re-parsing the expression per context
+IX_CONTEXT_END_XPATH = etree.XPath("string((.//*[local-name()='endDate'])[1])")
+IX_CONTEXT_INSTANT_XPATH = etree.XPath("string((.//*[local-name()='instant'])[1])")
+
+# Dotted UK dates dateutil rejects, checked in _parse_date's fallback (e.g. 31.12.17)
+DOTTED_DATE_SHORT_RE = re.compile(r'\d{2}\.\d{2}\.\d{2}')
+DOTTED_DATE_LONG_RE = re.compile(r'\d{2}\.\d{2}\.\d{4}')
+
+# Date layouts _parse_date reads with strptime before falling back to dateutil,
+# which is far slower and reads ISO dates day-first when dayfirst=True
+FAST_DATE_FORMATS = (
+    (re.compile(r'\d{4}-\d{2}-\d{2}'), '%Y-%m-%d'),
+    (re.compile(r'\d{8}'), '%Y%m%d'),
+    (re.compile(r'\d{2}/\d{2}/\d{4}'), '%d/%m/%Y'),
+    (DOTTED_DATE_LONG_RE, '%d.%m.%Y'),
+    (DOTTED_DATE_SHORT_RE, '%d.%m.%y'),
+)
+
+# Company number fallbacks for member filenames that do not follow the
+# Prod_Chunk_CompanyNumber_Date layout: 8 digits, or 2 letters + 6 digits (SC123456)
+FILENAME_COMPANY_NUMBER_RE = re.compile(r'(?:^|_)(\d{8})(?:_|\.)')
+FILENAME_PREFIXED_COMPANY_NUMBER_RE = re.compile(r'\b([A-Z]{2}\d{6})\b')
+# YYYYMMDD period end just before the member's extension (..._20180331.html)
+FILENAME_PERIOD_END_RE = re.compile(r'_(\d{8})\.')
+
+# XBRL elements that describe contexts and units rather than carry facts
+XBRL_STRUCTURAL_TAGS = frozenset({
+    'context', 'schemaRef', 'unit', 'entity', 'identifier', 'period',
+    'startDate', 'endDate', 'instant', 'segment',
+})
+
+# Archive members parse_chunks hands to the parser
+PARSEABLE_SUFFIXES = ('.xml', '.xbrl', '.html', '.htm', '.zip')
 
 
 class AccountsDataParser:
@@ -61,7 +130,8 @@ class AccountsDataParser:
     """
 
     TARGET_TABLE = 'staging_financials'
-    CHUNK_SIZE = 10_000  # Financial records per chunk
+    CHUNK_SIZE = 50_000  # Financial records per chunk (default; see chunk_size)
+    MEMBER_BATCH_SIZE = 32  # Archive members per process pool task (max_workers > 1)
 
     # Fields used to compute the change detection hash
     HASH_FIELDS = [
@@ -74,24 +144,55 @@ class AccountsDataParser:
         'net_assets_liabilities',
     ]
 
-    def __init__(self, file_path: Path, log_callback: Optional[Callable[[str], None]] = None):
+    def __init__(
+        self,
+        file_path: Path,
+        log_callback: Optional[Callable[[str], None]] = None,
+        max_workers: int = 1,
+        parse_cache_path: Optional[str] = None,
+        chunk_size: Optional[int] = None,
+    ):
         """
         Initialize parser with path to ZIP file.
 
         Args:
             file_path: Path to the ZIP file to parse
             log_callback: Optional function to log debug messages
+            max_workers: Processes used to parse archive members. Defaults to 1
+                (serial); pass e.g. os.cpu_count() when running standalone.
+            parse_cache_path: Optional SQLite file caching parsed records per
+                archive member, so filings seen on an earlier run are not re-parsed.
+            chunk_size: Records per yielded DataFrame. Defaults to CHUNK_SIZE;
+                each chunk is written with one COPY, so larger chunks mean fewer
+                round trips at the cost of memory.
         """
         self.file_path = Path(file_path)
         self.log_callback = log_callback or (lambda msg: None)
+        self.max_workers = max_workers
+        self.parse_cache_path = parse_cache_path
+        self.chunk_size = chunk_size or self.CHUNK_SIZE
         self._total_rows: int | None = None
+        # Set by the parse methods when they swallow an error, so callers can
+        # tell a failed member from one that simply has no records
+        self._parse_failed = False
         
-        # Initialize TagManager
-        # Assuming accounts_tags directory is in the same directory as this parser
-        parser_dir = Path(__file__).parent
+        # Initialize TagManager from the tag files shipped next to this parser
         self.tag_manager = TagManager(
-            tag_dict_path=str(parser_dir / 'tag_dictionary.json'),
-            taxonomy_dir=str(parser_dir / 'accounts_tags')
+            tag_dict_path=str(PARSER_DIR / 'tag_dictionary.json'),
+            taxonomy_dir=str(PARSER_DIR / 'accounts_tags')
+        )
+        self._tag_lookup = self.tag_manager.get_tag_lookup()
+        # Per column, the (lowercase local name, fuzzy name) fact keys of each
+        # potential tag in priority order, normalised once here instead of per
+        # column for every record
+        self._column_tag_keys = {
+            col: tuple(self._fact_keys(tag) for tag in self.tag_manager.get_potential_tags(col))
+            for col in self.tag_manager.get_all_keys()
+        }
+        # Columns filled from facts for each record; period_start is handled
+        # separately as a text date
+        self._record_columns = tuple(
+            col for col in self.tag_manager.get_all_keys() if col != 'period_start'
         )
 
     @property
@@ -106,6 +207,15 @@ class AccountsDataParser:
         Yields:
             pd.DataFrame: Normalized chunks of financial data
         """
+        cache = ParseCache(self.parse_cache_path, self.tag_manager.tag_dictionary) if self.parse_cache_path else None
+        try:
+            yield from self._parse_archive(cache)
+        finally:
+            if cache is not None:
+                cache.close()
+
+    def _parse_archive(self, cache: ParseCache | None) -> Iterator[pd.DataFrame]:
+        """Read the archive members and yield record chunks (body of parse_chunks)."""
         with ZipFile(self.file_path, 'r') as archive:
             records = []
             file_list = archive.namelist()
@@ -115,35 +225,24 @@ class AccountsDataParser:
             for name in file_list[:5]:
                 self.log_callback(f"Sample file: {name}")
 
-            for name in archive.namelist():
-                lower_name = name.lower()
+            # Members the parser handles, skipping directories and other files
+            members = [
+                name for name in file_list
+                if not name.endswith('/') and name.lower().endswith(PARSEABLE_SUFFIXES)
+            ]
 
-                # Skip directories
-                if name.endswith('/'):
-                    continue
+            for name, parsed in self._iter_cached_member_records(archive, members, cache):
+                lower_name = name.lower()
 
-                # Process XBRL or HTML/iXBRL files
-                if lower_name.endswith('.xml') or lower_name.endswith('.xbrl'):
-                    data = archive.read(name)
-                    parsed = self._parse_xbrl_bytes(data, name)
-                    if not parsed:
-                         self.log_callback(f"Parsed 0 records from XBRL file: {name}")
-                    records.extend(parsed)
-
-                elif lower_name.endswith('.html') or lower_name.endswith('.htm'):
-                    data = archive.read(name)
-                    parsed = self._parse_ixbrl_bytes(data, name)
-                    if not parsed:
-                         self.log_callback(f"Parsed 0 records from iXBRL file: {name}")
-                    records.extend(parsed)
-
-                # Check for nested ZIPs
-                elif lower_name.endswith('.zip'):
-                    nested_records = self._parse_nested_zip(archive, name)
-                    records.extend(nested_records)
+                if not parsed:
+                    if lower_name.endswith('.xml') or lower_name.endswith('.xbrl'):
+                        self.log_callback(f"Parsed 0 records from XBRL file: {name}")
+                    elif lower_name.endswith('.html') or lower_name.endswith('.htm'):
+                        self.log_callback(f"Parsed 0 records from iXBRL file: {name}")
+                records.extend(parsed)
 
                 # Yield chunk when we hit the size limit
-                if len(records) >= self.CHUNK_SIZE:
+                if len(records) >= self.chunk_size:
                     self.log_callback(f"Yielding chunk of {len(records)} records")
                     df = self._process_records(records)
                     if not df.empty:
@@ -156,6 +255,94 @@ class AccountsDataParser:
                 if not df.empty:
                     yield df
 
+    def _iter_cached_member_records(
+        self, archive: ZipFile, members: list[str], cache: ParseCache | None
+    ) -> Iterator[tuple[str, list[dict]]]:
+        """
+        _iter_member_records, answering members already in the parse cache from it.
+
+        Only the uncached members are parsed; results are merged back in archive
+        order and stored for the next run. Members whose parse failed are not
+        stored, so a corrupt download is retried rather than cached as empty.
+        """
+        if cache is None:
+            for name, parsed, _ in self._iter_member_records(archive, members):
+                yield name, parsed
+            return
+
+        keys = {name: cache.member_key(archive.getinfo(name)) for name in members}
+        hits = {name for name in members if cache.contains(keys[name])}
+        if hits:
+            self.log_callback(f"Parse cache: {len(hits)} of {len(members)} files already parsed")
+
+        fresh = self._iter_member_records(archive, [name for name in members if name not in hits])
+        for name in members:
+            if name in hits:
+                yield name, cache.get(keys[name])
+            else:
+                name, parsed, failed = next(fresh)
+                if not failed:
+                    cache.put(keys[name], parsed)
+                yield name, parsed
+
+    def _iter_member_records(self, archive: ZipFile, members: list[str]) -> Iterator[tuple[str, list[dict], bool]]:
+        """
+        Parse each XBRL/iXBRL/nested ZIP member, yielding (name, records, failed)
+        in archive order; failed is set when the parse raised and was logged.
+
+        Members are independent, so with max_workers > 1 they are fanned out to a
+        process pool. Reading stays in this process and only a bounded window of
+        members is in flight, so memory does not grow with the archive size.
+        """
+
+        workers = self.max_workers
+        # Daemonic processes (e.g. the ingestion worker's Pool) cannot start children
+        if workers <= 1 or multiprocessing.current_process().daemon:
+            for name in members:
+                self._parse_failed = False
+                lower_name = name.lower()
+                if lower_name.endswith('.xml') or lower_name.endswith('.xbrl'):
+                    # Feed the decompressing member stream straight to iterparse
+                    # rather than holding the whole document as bytes first
+                    with archive.open(name) as member:
+                        parsed = self._parse_xbrl_stream(member, name)
+                else:
+                    parsed = self._parse_member(name, archive.read(name))
+                yield name, parsed, self._parse_failed
+            return
+
+        # Most filings are a few KB, so members are shipped to workers in batches
+        # to amortise the per-task pickling and IPC round trip
+        pending: deque = deque()
+        with ProcessPoolExecutor(
+            max_workers=workers,
+            initializer=_init_member_worker,
+            initargs=(str(self.file_path),),
+        ) as executor:
+            for start in range(0, len(members), self.MEMBER_BATCH_SIZE):
+                batch = [(name, archive.read(name)) for name in members[start:start + self.MEMBER_BATCH_SIZE]]
+                names = [name for name, _ in batch]
+                pending.append((names, executor.submit(_parse_members_in_worker, batch)))
+                if len(pending) >= workers * 2:
+                    done_names, future = pending.popleft()
+                    for name, (parsed, failed) in zip(done_names, future.result()):
+                        yield name, parsed, failed
+            while pending:
+                done_names, future = pending.popleft()
+                for name, (parsed, failed) in zip(done_names, future.result()):
+                    yield name, parsed, failed
+
+    def _parse_member(self, name: str, data: bytes) -> list[dict]:
+        """Parse a single archive member by file extension."""
+        lower_name = name.lower()
+        if lower_name.endswith('.xml') or lower_name.endswith('.xbrl'):
+            return self._parse_xbrl_bytes(data, name)
+        if lower_name.endswith('.html') or lower_name.endswith('.htm'):
+            return self._parse_ixbrl_bytes(data, name)
+        if lower_name.endswith('.zip'):
+            return self._parse_nested_zip_bytes(data, name)
+        return []
+
     def _process_records(self, records: list[dict]) -> pd.DataFrame:
         """
         Process a list of raw records into a DataFrame.
@@ -180,15 +367,19 @@ class AccountsDataParser:
         
         df = df.drop_duplicates(subset=['company_number', 'period_end'], keep='last')
         
-        df['data_hash'] = df.apply(self._compute_row_hash, axis=1)
+        df['data_hash'] = compute_hashes(df, self.HASH_FIELDS)
         return df
 
-    def _parse_nested_zip(self, parent_archive: ZipFile, nested_name: str) -> list[dict]:
-        """Parse a ZIP file nested within the main archive."""
+    def _parse_nested_zip_bytes(self, nested_data: bytes, nested_name: str) -> list[dict]:
+        """
+        Parse the bytes of a ZIP file nested within the main archive.
+
+        ZipFile needs a seekable file, so the nested archive itself stays in
+        memory (io.BytesIO shares the bytes rather than copying them); its
+        members are decompressed one at a time.
+        """
         records = []
         try:
-            nested_data = parent_archive.read(nested_name)
-            import io
             with ZipFile(io.BytesIO(nested_data), 'r') as nested_archive:
                 for name in nested_archive.namelist():
                     lower_name = name.lower()
@@ -196,13 +387,16 @@ class AccountsDataParser:
                         continue
 
                     if lower_name.endswith('.xml') or lower_name.endswith('.xbrl'):
-                        data = nested_archive.read(name)
-                        records.extend(self._parse_xbrl_bytes(data, name))
+                        # Stream the inner member into iterparse, as for top-level
+                        # XBRL, instead of decompressing it to bytes first
+                        with nested_archive.open(name) as member:
+                            records.extend(self._parse_xbrl_stream(member, name))
                     elif lower_name.endswith('.html') or lower_name.endswith('.htm'):
                         data = nested_archive.read(name)
                         records.extend(self._parse_ixbrl_bytes(data, name))
         except Exception as e:
             print(f"Warning: Failed to parse nested ZIP {nested_name}: {e}")
+            self._parse_failed = True
         return records
 
     def _extract_company_number(self, filename: str) -> str | None:
@@ -220,12 +414,12 @@ class AccountsDataParser:
                  return candidate
 
         # 2. Fallback regex (improved to handle underscores)
-        match = re.search(r'(?:^|_)(\d{8})(?:_|\.)', filename)
+        match = FILENAME_COMPANY_NUMBER_RE.search(filename)
         if match:
              return match.group(1)
 
         # Try alphanumeric format (SC123456, etc.)
-        match = re.search(r'\b([A-Z]{2}\d{6})\b', filename)
+        match = FILENAME_PREFIXED_COMPANY_NUMBER_RE.search(filename)
         if match:
              return match.group(1)
         return None
@@ -236,12 +430,13 @@ class AccountsDataParser:
         Format: Prod223_2125_09652609_20180331.html -> 2018-03-31
         """
         # Look for YYYYMMDD before the extension
-        match = re.search(r'_(\d{8})\.', filename)
+        match = FILENAME_PERIOD_END_RE.search(filename)
         if match:
             date_str = match.group(1)
             try:
-                # Convert to YYYY-MM-DD
-                return datetime.strptime(date_str, '%Y%m%d').strftime('%Y-%m-%d')
+                # Convert to YYYY-MM-DD; date() validates the fields without a
+                # strptime/strftime round trip
+                return date(int(date_str[:4]), int(date_str[4:6]), int(date_str[6:])).isoformat()
             except ValueError:
                 pass
         return None
@@ -250,6 +445,14 @@ class AccountsDataParser:
         """Parse various date formats to YYYY-MM-DD."""
         if not date_str:
             return None
+        # Common fixed layouts first; anything else (or an invalid date in
+        # one of them) goes through dateutil as before
+        for pattern, fmt in FAST_DATE_FORMATS:
+            if pattern.fullmatch(date_str):
+                try:
+                    return datetime.strptime(date_str, fmt).strftime('%Y-%m-%d')
+                except ValueError:
+                    break
         try:
             # Try flexible parsing
             dt = dateutil.parser.parse(date_str, dayfirst=True) # UK dates usually day first
@@ -258,98 +461,70 @@ class AccountsDataParser:
             try:
                 # Fallbacks for specific edge cases if dateutil fails
                 # e.g., 31.12.17
-                if re.match(r'\d{2}\.\d{2}\.\d{2}', date_str):
+                if DOTTED_DATE_SHORT_RE.match(date_str):
                      return datetime.strptime(date_str, '%d.%m.%y').strftime('%Y-%m-%d')
-                if re.match(r'\d{2}\.\d{2}\.\d{4}', date_str):
+                if DOTTED_DATE_LONG_RE.match(date_str):
                      return datetime.strptime(date_str, '%d.%m.%Y').strftime('%Y-%m-%d')
             except ValueError:
                 pass
         return None
 
-    def _get_best_value(self, facts_by_period: dict, period_end: str, target_column: str) -> float | None:
+    def _index_facts(self, facts: dict) -> dict[str, tuple[int, Any]]:
+        """
+        Index one period's facts by lowercase local name.
+
+        Values are (position, value) for the first fact with that name, so lookups
+        can still prefer whichever fact came first in the document.
+        """
+        indexed: dict[str, tuple[int, Any]] = {}
+        for position, (fact_tag, value) in enumerate(facts.items()):
+            indexed.setdefault(local_key(fact_tag), (position, value))
+        return indexed
+
+    def _get_best_value(self, indexed_facts: dict[str, tuple[int, Any]], target_column: str) -> float | None:
         """
         Try to find a value for the target_column using all potential tags.
+
+        indexed_facts is the period's numeric facts as built by _index_facts.
         """
-        potential_tags = self.tag_manager.get_potential_tags(target_column)
-        
-        # Check if period exists
-        if period_end not in facts_by_period:
-            return None
-            
-        facts = facts_by_period[period_end]
-        
-        for tag in potential_tags:
-            tag_local = self._localname(tag).lower()
-            
-            for fact_tag, value in facts.items():
-                fact_tag_local = self._localname(fact_tag).lower()
-                
-                # Check for exact match of local name
-                if fact_tag_local == tag_local:
-                    return value
-                
-                # Also check without hyphens etc if fuzzy?
-                if fact_tag_local == tag_local.replace('-', '').replace('_', ''):
-                    return value
+        for tag_keys in self._column_tag_keys.get(target_column, ()):
+            # Exact local name, or without hyphens etc if fuzzy; when both are
+            # present the earlier fact wins
+            hits = [indexed_facts[key] for key in tag_keys if key in indexed_facts]
+            if hits:
+                return min(hits, key=lambda hit: hit[0])[1]
                     
         return None
 
-    def _get_best_text_value(self, text_facts_by_period: dict, period_end: str, target_column: str) -> str | None:
+    def _get_best_text_value(self, indexed_text_facts: dict[str, tuple[int, Any]], target_column: str) -> str | None:
         """
         Same as _get_best_value but for text fields (like period_start).
         """
-        potential_tags = self.tag_manager.get_potential_tags(target_column)
-        
-        # Use wildcard period or specific period logic?
-        # Non-numeric facts (like period start) might be associated with the same context/period as the numeric facts.
-        
-        if period_end not in text_facts_by_period:
-             # Try to search in 'unknown' period or global context?
-             # Often period start is defined IN the context.
-             # But if we are looking for a TAG that contains the start date (user requirement), it follows standard tag logic.
-             if period_end not in text_facts_by_period:
-                 return None
-
-        facts = text_facts_by_period[period_end]
-        for tag in potential_tags:
-            tag_local = self._localname(tag).lower()
-            for fact_tag, value in facts.items():
-                fact_tag_local = self._localname(fact_tag).lower()
-                if fact_tag_local == tag_local:
-                    return value
-        return None
-
-    def _extract_company_number_xbrl(self, root: ET.Element) -> str | None:
-        """Helper to extract company number from XBRL XML."""
-        # Try standard identifier
-        for identifier in root.findall('.//*{*}identifier'):
-            text = (identifier.text or '').strip()
-            # print(f"DEBUG: Found identifier: {text}")
-            if text and (len(text) == 8 and text.isdigit()) or (len(text) == 8 and text[0:2].isalpha()):
-                 return text
-        
-        # Try CompaniesHouseRegisteredNumber
-        for num_tag in root.findall('.//*{*}CompaniesHouseRegisteredNumber'):
-            text = (num_tag.text or '').strip()
-            # print(f"DEBUG: Found CompaniesHouseRegisteredNumber: {text}")
-            if text:
-                 return text
+        # Non-numeric facts (like period start) are associated with the same context/period as the numeric facts.
+        for tag_local, _ in self._column_tag_keys.get(target_column, ()):
+            hit = indexed_text_facts.get(tag_local)
+            if hit is not None:
+                return hit[1]
         return None
 
     def _extract_company_number_ixbrl(self, html_text: str) -> str | None:
          # Search for identifier elements in HTML
-        identifier_pattern = re.compile(
-            r'<(?:xbrli:)?identifier[^>]*>([^<]+)</(?:xbrli:)?identifier>',
-            re.IGNORECASE
-        )
-        match = identifier_pattern.search(html_text)
+        match = IX_IDENTIFIER_RE.search(html_text)
         if match:
             return match.group(1).strip()
         return None
 
     def _parse_xbrl_bytes(self, data: bytes, filename: str) -> list[dict]:
+        """Parse XBRL XML data held in memory."""
+        return self._parse_xbrl_stream(io.BytesIO(data), filename)
+
+    def _parse_xbrl_stream(self, stream: BinaryIO, filename: str) -> list[dict]:
         """
-        Parse XBRL XML data.
+        Parse XBRL XML data from a binary stream.
+
+        The document is streamed with iterparse in a single pass: contexts and
+        facts are read as their end tags arrive and then cleared, so memory stays
+        bounded by the largest element rather than the whole DOM.
         """
         # 1. Company Number
         company_number = self._extract_company_number(filename)
@@ -357,60 +532,79 @@ class AccountsDataParser:
         # 2. Period End from filename (Primary source)
         filename_period_end = self._extract_period_end_from_filename(filename)
 
-        records = []
+        # Build context date mapping
+        ctx_dates: dict[str, dict] = {} # id -> {'end': '...', 'start': '...'}
+        # (tag, text, contextRef) in document order for facts some column can use;
+        # resolved once all contexts are known
+        raw_facts: list[tuple[str, str, str | None]] = []
+        tag_lookup = self._tag_lookup
+        # startDate/endDate/instant text seen since the last context closed
+        period_dates: dict[str, str | None] = {}
+        identifier_number = None
+        registered_number = None
+
         try:
-            root = ET.fromstring(data)
+            for _, el in etree.iterparse(stream, events=('end',), huge_tree=True, resolve_entities=False):
+                tag = el.tag # qualified name
+                # Local part sliced off the Clark-notation tag; cheaper than
+                # building an etree.QName for every element
+                local = tag[tag.rfind('}') + 1:]
+
+                # Period dates end before their context does, so they are
+                # collected on the way rather than searched for afterwards
+                if local in ('startDate', 'endDate', 'instant'):
+                    if period_dates.get(local) is None:
+                        period_dates[local] = el.text
+                    continue
+
+                if local == 'context':
+                    ctx_id = el.attrib.get('id')
+                    if ctx_id:
+                        end_val = period_dates.get('endDate') or period_dates.get('instant')
+                        if end_val:
+                            ctx_dates[ctx_id] = {'end': end_val, 'start': period_dates.get('startDate')}
+                    period_dates = {}
+                    self._release_element(el)
+                    continue
+
+                text = (el.text or '').strip()
+
+                # Company number candidates, used if the filename does not carry one
+                if local == 'identifier':
+                    if identifier_number is None and (text and (len(text) == 8 and text.isdigit()) or (len(text) == 8 and text[0:2].isalpha())):
+                        identifier_number = text
+                elif local == 'CompaniesHouseRegisteredNumber':
+                    if registered_number is None and text:
+                        registered_number = text
+
+                # Skip structural tags
+                if local in XBRL_STRUCTURAL_TAGS:
+                    continue
+
+                ctx_ref = el.attrib.get('contextRef')
+                # Match on the local part already computed above; facts no
+                # dictionary column can use are never stored
+                if text and local.lower() in tag_lookup:
+                    raw_facts.append((tag, text, ctx_ref))
+                if ctx_ref is not None:
+                    self._release_element(el)
         except Exception as e:
             print(f"Warning: XBRL parse failed for {filename}: {e}")
+            self._parse_failed = True
             return []
 
         if not company_number:
-            company_number = self._extract_company_number_xbrl(root)
+            company_number = identifier_number or registered_number
         
         if not company_number:
             self.log_callback(f"Skipping {filename}: No company number found")
             return []
-
-        # Build context date mapping
-        ctx_dates: dict[str, dict] = {} # id -> {'end': '...', 'start': '...'}
         
-        # Use iter() to be robust against namespace issues in findall
-        for ctx in root.iter():
-            if self._localname(ctx.tag) != 'context':
-                continue
-
-            ctx_id = ctx.attrib.get('id')
-            if not ctx_id: continue
-            
-            end_el = ctx.find('.//*{*}endDate')
-            start_el = ctx.find('.//*{*}startDate')
-            inst_el = ctx.find('.//*{*}instant')
-            
-            end_val = (end_el.text if end_el is not None else None) or \
-                      (inst_el.text if inst_el is not None else None)
-            start_val = (start_el.text if start_el is not None else None)
-            
-            if end_val:
-                ctx_dates[ctx_id] = {'end': end_val, 'start': start_val}
-        
-        # DEBUG: Log context dates
-        self.log_callback(f"DEBUG: Found Contexts: {list(ctx_dates.keys())}")
-
         # Collect facts
         facts_by_period: dict[str, dict[str, float]] = {}
         text_facts_by_period: dict[str, dict[str, str]] = {}
         
-        for el in root.iter():
-            tag = el.tag # qualified name
-            # Skip structural tags
-            local = self._localname(tag)
-            if local in {'context', 'schemaRef', 'unit', 'entity', 'identifier', 'period', 'startDate', 'endDate', 'instant', 'segment'}:
-                continue
-
-            text = (el.text or '').strip()
-            if not text: continue
-            
-            ctx_ref = el.attrib.get('contextRef')
+        for tag, text, ctx_ref in raw_facts:
             # Determine period for this fact
             # Use filename period if available? No, contextRef determines the period of the FACT.
             # But we only want facts that match the REPORT period (filename period).
@@ -426,12 +620,12 @@ class AccountsDataParser:
             # Or store it and filter later.
             # Let's group by period logic from context.
             
-            # Numeric check
-            try:
-                val = float(text.replace(',', ''))
+            # Numeric check - pattern test first so text facts never raise
+            cleaned = text.translate(XBRL_NUMBER_STRIP)
+            if NUMBER_RE.fullmatch(cleaned):
                 bucket = facts_by_period.setdefault(fact_period_end, {})
-                bucket[tag] = val # Store full tag for matching
-            except ValueError:
+                bucket[tag] = float(cleaned) # Store full tag for matching
+            else:
                 bucket = text_facts_by_period.setdefault(fact_period_end, {})
                 bucket[tag] = text
 
@@ -448,36 +642,29 @@ class AccountsDataParser:
         if not record_periods and 'unknown' in facts_by_period:
              pass 
 
-        # DEBUG: Log keys unconditionally
-        self.log_callback(f"DEBUG: Target Period: {target_period}")
-        self.log_callback(f"DEBUG: Facts Keys: {list(facts_by_period.keys())}")
-        if target_period and target_period in facts_by_period:
-             found_tags = list(facts_by_period[target_period].keys())
-             self.log_callback(f"DEBUG: Found tags for {target_period}: {found_tags}")
-        
         parsed_records = []
         for p_end in record_periods:
             if not p_end: continue
             
             # Initialize record for this period
             record = {}
+            period_facts = self._index_facts(facts_by_period.get(p_end, {}))
+            period_text_facts = self._index_facts(text_facts_by_period.get(p_end, {}))
             
             # specific tag logic
             # Dynamic extraction for all keys in tag dictionary
-            for col_name in self.tag_manager.get_all_keys():
-                if col_name == 'period_start': continue
-                
+            for col_name in self._record_columns:
                 # Try numeric
-                val = self._get_best_value(facts_by_period, p_end, col_name)
+                val = self._get_best_value(period_facts, col_name)
                 if val is None:
                      # Try text
-                     val = self._get_best_text_value(text_facts_by_period, p_end, col_name)
+                     val = self._get_best_text_value(period_text_facts, col_name)
                 
                 record[col_name] = val
             
             # Period Start: Try tag first, then context
             period_start = None
-            raw_start_date = self._get_best_text_value(text_facts_by_period, p_end, 'period_start')
+            raw_start_date = self._get_best_text_value(period_text_facts, 'period_start')
             if raw_start_date:
                 period_start = self._parse_date(raw_start_date)
             
@@ -495,7 +682,7 @@ class AccountsDataParser:
                 'period_end': p_end,
                 'period_start': period_start,
                 'source': 'bulk_xbrl',
-                'raw_data': {} # Can populate if needed
+                # raw_data is left to the loader, which fills '{}' when absent
             })
             parsed_records.append(record)
             
@@ -511,62 +698,50 @@ class AccountsDataParser:
         filename_period_end = self._extract_period_end_from_filename(filename)
 
         try:
-            text = data.decode('utf-8', errors='ignore')
-        except Exception as e:
-            print(f"Warning: iXBRL decode failed for {filename}: {e}")
-            return []
+            root = etree.fromstring(data, parser=IXBRL_XML_PARSER)
+        except Exception:
+            root = None
+
+        # iXBRL is XHTML, so lxml can read most filings directly. Documents it
+        # cannot recover any facts from (e.g. undeclared ix: prefixes) still go
+        # through the regex scan.
+        tree_values = self._read_ixbrl_tree(root) if root is not None else None
+        if tree_values is not None:
+            identifier, ctx_dates, numeric_facts, text_facts = tree_values
+        else:
+            try:
+                text = data.decode('utf-8', errors='ignore')
+            except Exception as e:
+                print(f"Warning: iXBRL decode failed for {filename}: {e}")
+                self._parse_failed = True
+                return []
+            identifier, ctx_dates, numeric_facts, text_facts = self._read_ixbrl_text(text)
 
         if not company_number:
-            company_number = self._extract_company_number_ixbrl(text)
-        
+            company_number = identifier
+
         if not company_number:
             self.log_callback(f"Skipping {filename}: No company number found")
             return []
 
-        # Build context mapping
-        ctx_dates: dict[str, dict] = {}
-        for m in IX_CONTEXT_RE.finditer(text):
-            ctx_id = m.group('id')
-            # Extract end date, maybe start date too? 
-            # Regex needs to be smarter to capture startDate.
-            # Simplified regex used above only captured 'end'. 
-            # For iXBRL full support, we'd need a stronger parser, but staying with regex as per existing code style.
-            end_val = m.group('end')
-            if ctx_id and end_val:
-                ctx_dates[ctx_id] = {'end': end_val}
-
         # Collect facts
         facts_by_period: dict[str, dict[str, float]] = {}
         text_facts_by_period: dict[str, dict[str, str]] = {}
 
         # Numeric values
-        matches = []
-        matches.extend(IX_NONFRACTION_RE_1.finditer(text))
-        matches.extend(IX_NONFRACTION_RE_2.finditer(text))
-
-        for m in matches:
-            name = m.group('name') # e.g. uk-gaap:Turnover
-            ctx = m.group('context')
-            raw_val = re.sub(r'<.*?>', '', m.group('value') or '').strip()
-            
+        for name, ctx, raw_val in numeric_facts:
             fact_period_end = ctx_dates.get(ctx, {}).get('end', 'unknown')
             
-            try:
-                # Handle sign? (format like (1,234) for negative?)
-                # Assuming standard float parse for now
-                val = float(raw_val.replace(',', '').replace(' ', ''))
+            # Handle sign? (format like (1,234) for negative?)
+            # Assuming standard float parse for now
+            cleaned = raw_val.translate(IXBRL_NUMBER_STRIP)
+            if NUMBER_RE.fullmatch(cleaned):
                 # Handle sign attribute? (not parsed yet)
                 bucket = facts_by_period.setdefault(fact_period_end, {})
-                bucket[name] = val
-            except ValueError:
-                pass
+                bucket[name] = float(cleaned)
         
         # Text values (for dates etc)
-        # Regex for nonNumeric
-        for m in IX_NONNUMERIC_RE.finditer(text):
-            name = m.group('name')
-            ctx = m.group('context')
-            raw_val = re.sub(r'<.*?>', '', m.group('value') or '').strip()
+        for name, ctx, raw_val in text_facts:
             fact_period_end = ctx_dates.get(ctx, {}).get('end', 'unknown')
             
             bucket = text_facts_by_period.setdefault(fact_period_end, {})
@@ -583,13 +758,12 @@ class AccountsDataParser:
             
             # Initialize record
             record = {}
+            period_facts = self._index_facts(facts_by_period.get(p_end, {}))
+            period_text_facts = self._index_facts(text_facts_by_period.get(p_end, {}))
             
             # specific tag logic
             # Dynamic extraction for all keys in tag dictionary
-            for col_name in self.tag_manager.get_all_keys():
-                # Skip period_start, handled separately as text/date
-                if col_name == 'period_start': continue
-                
+            for col_name in self._record_columns:
                 # Check known types if needed, or assume numeric if not in a 'text_fields' list?
                 # For now, most matching standard logic are numeric.
                 # But some are text (e.g. description_body...). 
@@ -598,15 +772,15 @@ class AccountsDataParser:
                 # Or check explicit list.
                 
                 # Better: try numeric extraction first
-                val = self._get_best_value(facts_by_period, p_end, col_name)
+                val = self._get_best_value(period_facts, col_name)
                 if val is None:
                      # Try text extraction
-                     val = self._get_best_text_value(text_facts_by_period, p_end, col_name)
+                     val = self._get_best_text_value(period_text_facts, col_name)
                 
                 record[col_name] = val
             
             period_start = None
-            raw_start_date = self._get_best_text_value(text_facts_by_period, p_end, 'period_start')
+            raw_start_date = self._get_best_text_value(period_text_facts, 'period_start')
             if raw_start_date:
                 period_start = self._parse_date(raw_start_date)
 
@@ -615,31 +789,109 @@ class AccountsDataParser:
                 'period_end': p_end,
                 'period_start': period_start,
                 'source': 'bulk_xbrl',
-                'raw_data': {} 
             })
             parsed_records.append(record)
 
         return parsed_records
 
-    def _localname(self, tag: str) -> str:
-        """Extract local name from qualified tag."""
-        if '}' in tag:
-            return tag.split('}', 1)[1]
-        if ':' in tag:
-            return tag.split(':', 1)[1]
-        return tag
+    def _read_ixbrl_tree(self, root: etree._Element) -> tuple | None:
+        """
+        Read identifier, context end dates and candidate facts from a parsed iXBRL tree.
 
-    def _compute_row_hash(self, row: pd.Series) -> str:
-        """Compute MD5 hash for change detection."""
-        values = []
-        for field in self.HASH_FIELDS:
-            val = row.get(field, '')
-            if pd.isna(val):
-                val = ''
-            values.append(str(val))
+        Walks the document once, picking out facts, contexts and identifiers as
+        they come. Returns (identifier, ctx_dates, numeric_facts, text_facts) where
+        the fact lists hold (name, contextRef, raw text) for tags the TagManager
+        maps, or None if the tree holds no ix facts at all.
+        """
+        identifier = None
+        ctx_dates: dict[str, dict] = {}
+        numeric_facts = []
+        text_facts = []
+        has_facts = False
+
+        for el in root.iter(*IX_TREE_TAGS):
+            tag = el.tag
+            local = tag[tag.rfind('}') + 1:]
+            if local == 'nonFraction' or local == 'nonNumeric':
+                has_facts = True
+                name = el.get('name')
+                if not name or local_key(name) not in self._tag_lookup:
+                    continue
+                raw_val = ''.join(el.itertext()).strip()
+                if local == 'nonFraction':
+                    numeric_facts.append((name, el.get('contextRef'), raw_val))
+                else:
+                    text_facts.append((name, el.get('contextRef'), raw_val))
+            elif local == 'context':
+                ctx_id = el.get('id')
+                end_val = IX_CONTEXT_END_XPATH(el) or IX_CONTEXT_INSTANT_XPATH(el)
+                if ctx_id and end_val:
+                    ctx_dates[ctx_id] = {'end': str(end_val)}
+            elif identifier is None and el.text and el.text.strip():
+                identifier = el.text.strip()
+
+        if not has_facts:
+            return None
+        return identifier, ctx_dates, numeric_facts, text_facts
 
-        hash_string = '|'.join(values)
-        return hashlib.md5(hash_string.encode('utf-8')).hexdigest()
+    def _read_ixbrl_text(self, text: str) -> tuple:
+        """
+        Regex fallback for iXBRL documents lxml could not read facts from.
+
+        Returns the same (identifier, ctx_dates, numeric_facts, text_facts) shape
+        as _read_ixbrl_tree.
+        """
+        identifier = self._extract_company_number_ixbrl(text)
+
+        # Build context mapping
+        ctx_dates: dict[str, dict] = {}
+        for m in IX_CONTEXT_RE.finditer(text):
+            ctx_id = m.group('id')
+            end_val = m.group('end')
+            if ctx_id and end_val:
+                ctx_dates[ctx_id] = {'end': end_val}
+
+        # Numeric and text (dates etc) values in one pass over the opening tags;
+        # only facts some column can use have their value extracted
+        numeric_facts = []
+        text_facts = []
+        for m in IX_FACT_OPEN_RE.finditer(text):
+            attrs = m.group('attrs')
+            name_match = IX_NAME_ATTR_RE.search(attrs)
+            if not name_match:
+                continue
+            name = name_match.group(1) # e.g. uk-gaap:Turnover
+            if local_key(name) not in self._tag_lookup:
+                continue
+            context_match = IX_CONTEXT_ATTR_RE.search(attrs)
+            if not context_match:
+                continue
+            context = context_match.group(1)
+            kind = m.group('kind').lower()
+            close = IX_FACT_CLOSE_RES[kind].search(text, m.end())
+            if close is None:
+                continue
+            raw_val = IX_TAG_STRIP_RE.sub('', text[m.end():close.start()]).strip()
+            if kind == 'nonfraction':
+                numeric_facts.append((name, context, raw_val))
+            else:
+                text_facts.append((name, context, raw_val))
+
+        return identifier, ctx_dates, numeric_facts, text_facts
+
+    @staticmethod
+    def _release_element(el: etree._Element) -> None:
+        """Free a processed iterparse element and its already-processed siblings."""
+        el.clear()
+        parent = el.getparent()
+        if parent is not None:
+            while el.getprevious() is not None:
+                del parent[0]
+
+    def _fact_keys(self, tag: str) -> tuple[str, str]:
+        """Return the exact and fuzzy _index_facts keys a dictionary tag matches."""
+        tag_local = local_key(tag)
+        return tag_local, tag_local.replace('-', '').replace('_', '')
 
     @classmethod
     def compute_hash(cls, data: dict[str, Any]) -> str:
@@ -653,3 +905,21 @@ class AccountsDataParser:
 
         hash_string = '|'.join(values)
         return hashlib.md5(hash_string.encode('utf-8')).hexdigest()
+
+
+# Process pool helpers for AccountsDataParser(max_workers > 1). Each worker builds
+# its own parser once so the tag dictionary is not reloaded per member.
+_worker_parser: AccountsDataParser | None = None
+
+
+def _init_member_worker(file_path: str) -> None:
+    global _worker_parser
+    _worker_parser = AccountsDataParser(Path(file_path))
+
+
+def _parse_members_in_worker(batch: list[tuple[str, bytes]]) -> list[tuple[list[dict], bool]]:
+    results = []
+    for name, data in batch:
+        _worker_parser._parse_failed = False
+        results.append((_worker_parser._parse_member(name, data), _worker_parser._parse_failed))
+    return results
@@ -0,0 +1,68 @@
+import hashlib
+import json
+import sqlite3
+from pathlib import Path
+from typing import Dict, List, Optional
+from zipfile import ZipInfo
+
+# Bump when a parser change alters the records produced for the same document,
+# so entries written by older code are no longer matched
+PARSE_CACHE_VERSION = 4
+
+
+class ParseCache:
+    """
+    Persistent cache of parsed accounts records, keyed by archive member.
+
+    Filings reappear across bulk files (the monthly archives repeat the daily
+    files), so parsing the same document again on a later run is wasted work.
+    A member is identified by its name, CRC-32 and size from the ZIP directory,
+    which costs nothing to read, plus a fingerprint of the tag dictionary so
+    edits to it (including reordering a column's tag priorities) invalidate old
+    entries.
+
+    Each put() is committed on its own: several ingestion processes may share
+    the file, and a write transaction held open across many members would lock
+    the others out.
+    """
+
+    def __init__(self, cache_path: str, tag_dictionary: Dict[str, List[str]]):
+        self.cache_path = Path(cache_path)
+        self.cache_path.parent.mkdir(parents=True, exist_ok=True)
+
+        # Key and tag order both matter, so hash the dictionary as loaded
+        fingerprint = json.dumps(tag_dictionary)
+        self.namespace = f"{PARSE_CACHE_VERSION}:{hashlib.md5(fingerprint.encode('utf-8')).hexdigest()}"
+
+        # Several ingestion processes may share the file; wait on their write locks
+        self._conn = sqlite3.connect(str(self.cache_path), timeout=60)
+        self._conn.execute('PRAGMA journal_mode=WAL')
+        # Durable enough for a cache, and keeps a commit per member cheap
+        self._conn.execute('PRAGMA synchronous=NORMAL')
+        self._conn.execute(
+            'CREATE TABLE IF NOT EXISTS parsed_members (key TEXT PRIMARY KEY, records TEXT NOT NULL)'
+        )
+        self._conn.commit()
+
+    def member_key(self, info: ZipInfo) -> str:
+        """Cache key for an archive member."""
+        return f"{self.namespace}:{info.filename}:{info.CRC:08x}:{info.file_size}"
+
+    def contains(self, key: str) -> bool:
+        row = self._conn.execute('SELECT 1 FROM parsed_members WHERE key = ?', (key,)).fetchone()
+        return row is not None
+
+    def get(self, key: str) -> Optional[List[dict]]:
+        row = self._conn.execute('SELECT records FROM parsed_members WHERE key = ?', (key,)).fetchone()
+        return json.loads(row[0]) if row else None
+
+    def put(self, key: str, records: List[dict]) -> None:
+        # The connection context manager commits, releasing the write lock at once
+        with self._conn:
+            self._conn.execute(
+                'INSERT OR REPLACE INTO parsed_members (key, records) VALUES (?, ?)',
+                (key, json.dumps(records)),
+            )
+
+    def close(self) -> None:
+        self._conn.close()
@@ -1,7 +1,39 @@
 import json
 import csv
+import os
+from functools import lru_cache
 from pathlib import Path
-from typing import Dict, List, Optional
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+# Parsed tag files per process, keyed by (path, mtime_ns, size). Parsers are built
+# once per archive, so unchanged files are read from disk only once per process.
+_FILE_CACHE: Dict[Tuple[str, int, int], Any] = {}
+
+
+@lru_cache(maxsize=4096)
+def local_key(tag: str) -> str:
+    """
+    Lowercase local name of a qualified tag ('{ns}Turnover' or 'uk-gaap:Turnover').
+
+    Memoised: filings draw on a small, fixed tag vocabulary, so nearly every
+    call after the first few documents is a cache hit.
+    """
+    if '}' in tag:
+        tag = tag.split('}', 1)[1]
+    elif ':' in tag:
+        tag = tag.split(':', 1)[1]
+    return tag.lower()
+
+
+def _load_cached(path: Path, loader: Callable[[Path], Any], stat: Optional[os.stat_result] = None) -> Any:
+    """Return loader(path), reusing the previous result while the file is unchanged."""
+    if stat is None:
+        stat = path.stat()
+    key = (str(path.resolve()), stat.st_mtime_ns, stat.st_size)
+    if key not in _FILE_CACHE:
+        _FILE_CACHE[key] = loader(path)
+    return _FILE_CACHE[key]
+
 
 class TagManager:
     """
@@ -12,6 +44,7 @@ class TagManager:
         self.tag_dict_path = Path(tag_dict_path)
         self.taxonomy_dir = Path(taxonomy_dir)
         self.tag_dictionary: Dict[str, List[str]] = {}
+        self.tag_lookup: Dict[str, str] = {} # normalised tag -> standardized_name
         self.taxonomies: Dict[str, Dict[str, List[str]]] = {} # taxonomy_name -> {standardized_name -> [tags]}
 
         self._load_tag_dictionary()
@@ -20,35 +53,62 @@ class TagManager:
     def _load_tag_dictionary(self):
         """Loads the tag definition JSON."""
         if self.tag_dict_path.exists():
-            with open(self.tag_dict_path, 'r', encoding='utf-8') as f:
-                self.tag_dictionary = json.load(f)
+            self.tag_dictionary = _load_cached(self.tag_dict_path, self._read_tag_dictionary)
+            self._build_tag_lookup()
         else:
             print(f"Warning: Tag dictionary not found at {self.tag_dict_path}")
 
+    @staticmethod
+    def _read_tag_dictionary(path: Path) -> Dict[str, List[str]]:
+        with open(path, 'r', encoding='utf-8') as f:
+            return json.load(f)
+
+    def _build_tag_lookup(self):
+        """Inverts the dictionary into a flat {normalised tag: standardized_name} map."""
+        for column_name, tags in self.tag_dictionary.items():
+            for tag in tags:
+                # Same key facts are looked up by, so prefixed dictionary
+                # entries (uk-gaap:Turnover) still match
+                normalised = local_key(tag)
+                self.tag_lookup.setdefault(normalised, column_name)
+                self.tag_lookup.setdefault(normalised.replace('-', '').replace('_', ''), column_name)
+
     def _load_taxonomies(self):
         """Loads all CSV taxonomy files from the directory."""
         # Map filenames to short taxonomy names if needed, or just use filename stem
         # Expected files: all.csv, char.csv, frs-102.csv, uk-gaap-full.csv
-        for csv_file in self.taxonomy_dir.glob('*.csv'):
+        if not self.taxonomy_dir.is_dir():
+            return
+
+        # One scandir pass; DirEntry carries the type and stat, so no per-file re-stat
+        with os.scandir(self.taxonomy_dir) as entries:
+            csv_entries = [
+                entry for entry in entries
+                if entry.name.endswith('.csv') and not entry.name.startswith('.') and entry.is_file()
+            ]
+
+        for entry in csv_entries:
+            csv_file = Path(entry.path)
             taxonomy_name = csv_file.stem # e.g., 'frs-102', 'char'
             self.taxonomies[taxonomy_name] = {}
             
             try:
-                with open(csv_file, 'r', encoding='utf-8') as f:
-                    reader = csv.DictReader(f)
-                    for row in reader:
-                        tag = row.get('Element Name')
-                        if tag:
-                            # Just store existence for now
-                            if taxonomy_name not in self.taxonomies:
-                                self.taxonomies[taxonomy_name] = {}
-                            if 'tags' not in self.taxonomies[taxonomy_name]:
-                                self.taxonomies[taxonomy_name]['tags'] = []
-                            self.taxonomies[taxonomy_name]['tags'].append(tag)
-                            
+                self.taxonomies[taxonomy_name] = _load_cached(csv_file, self._read_taxonomy_csv, entry.stat())
             except Exception as e:
                 print(f"Error loading taxonomy {csv_file}: {e}")
 
+    @staticmethod
+    def _read_taxonomy_csv(csv_file: Path) -> Dict[str, List[str]]:
+        taxonomy: Dict[str, List[str]] = {}
+        with open(csv_file, 'r', encoding='utf-8') as f:
+            reader = csv.DictReader(f)
+            for row in reader:
+                tag = row.get('Element Name')
+                if tag:
+                    # Just store existence for now
+                    taxonomy.setdefault('tags', []).append(tag)
+        return taxonomy
+
     def get_all_keys(self) -> List[str]:
         """Return all standardized column names defined in the dictionary."""
         return list(self.tag_dictionary.keys())
@@ -60,4 +120,11 @@ class TagManager:
         # The dictionary now directly holds the list of tags
         return self.tag_dictionary.get(column_name, [])
 
+    def get_tag_lookup(self) -> Dict[str, str]:
+        """
+        Returns the flat {lowercase local tag name: standardized name} lookup,
+        for O(1) checks of whether a fact can map to any column.
+        """
+        return self.tag_lookup
+
 
@@ -3,6 +3,8 @@ Parser for Companies House Company Data bulk CSV files.
 """
 from __future__ import annotations
 
+import math
+
 import pandas as pd
 
 from staging.common.parsers.base_parser import BulkDataParser
@@ -78,6 +80,22 @@ class CompanyDataParser(BulkDataParser):
         'previous_names'
     ]
 
+    # Source columns folded into derived ones by transform(), built once per class
+    SIC_COLUMNS = [f'sic_code_{i}' for i in range(1, 5)]
+    PREVIOUS_NAME_COLUMNS = [f'temp_prev_name_{i}' for i in range(1, 11)]
+    REF_DATE_COLUMNS = ['temp_acc_ref_day', 'temp_acc_ref_month']
+    DATE_FORMAT = '%d/%m/%Y'
+    ISO_DATE_FORMAT = '%Y-%m-%d'  # Retried for values that are not DATE_FORMAT
+    DATE_COLUMNS = [
+        'incorporation_date',
+        'accounts_last_made_up_date',
+        'accounts_next_due_date',
+        'returns_next_due_date',
+        'returns_last_made_up_date',
+        'conf_stm_next_due_date',
+        'conf_stm_last_made_up_date'
+    ]
+
     def transform(self, df: pd.DataFrame) -> pd.DataFrame:
         """
         Apply company-specific transformations.
@@ -90,84 +108,96 @@ class CompanyDataParser(BulkDataParser):
         - Normalize Date Formats (DD/MM/YYYY -> YYYY-MM-DD)
         """
         # Extract SIC codes into array column
-        df['sic_codes'] = df.apply(self._extract_sic_codes, axis=1)
-
-        # Drop individual SIC code columns after extraction
-        sic_cols = ['sic_code_1', 'sic_code_2', 'sic_code_3', 'sic_code_4']
-        df = df.drop(columns=[c for c in sic_cols if c in df.columns], errors='ignore')
+        df['sic_codes'] = self._extract_sic_codes(df)
 
         # Normalize company status to lowercase
         if 'company_status' in df.columns:
             df['company_status'] = df['company_status'].str.lower().str.strip()
 
         # Combine Account Ref Day/Month -> "MM-DD"
-        if 'temp_acc_ref_day' in df.columns and 'temp_acc_ref_month' in df.columns:
-            df['accounts_ref_date'] = df.apply(self._format_ref_date, axis=1)
-            df = df.drop(columns=['temp_acc_ref_day', 'temp_acc_ref_month'], errors='ignore')
+        if all(c in df.columns for c in self.REF_DATE_COLUMNS):
+            df['accounts_ref_date'] = self._format_ref_date(df)
 
         # Combine Previous Names -> "Name1|Name2|..."
-        df['previous_names'] = df.apply(self._combine_previous_names, axis=1)
-        # Drop temp previous name colums
-        prev_cols = [f'temp_prev_name_{i}' for i in range(1, 11)]
-        df = df.drop(columns=[c for c in prev_cols if c in df.columns], errors='ignore')
+        df['previous_names'] = self._combine_previous_names(df)
+
+        # Drop the individual SIC, ref day/month and previous name columns in a
+        # single drop (each drop copies the frame)
+        df = df.drop(
+            columns=[c for c in self.SIC_COLUMNS + self.REF_DATE_COLUMNS + self.PREVIOUS_NAME_COLUMNS if c in df.columns]
+        )
 
         # Fix Date Formats (DD/MM/YYYY -> YYYY-MM-DD)
-        date_cols = [
-            'incorporation_date',
-            'accounts_last_made_up_date',
-            'accounts_next_due_date',
-            'returns_next_due_date',
-            'returns_last_made_up_date',
-            'conf_stm_next_due_date',
-            'conf_stm_last_made_up_date'
-        ]
-        
-        for col in date_cols:
+        for col in self.DATE_COLUMNS:
             if col in df.columns:
                 # Convert to datetime, coercing errors to NaT, then format as YYYY-MM-DD
-                # Companies House dates are typically DD/MM/YYYY
-                df[col] = pd.to_datetime(df[col], dayfirst=True, errors='coerce').dt.strftime('%Y-%m-%d')
+                # Companies House dates are DD/MM/YYYY; an explicit format keeps
+                # the whole column on the vectorised parser instead of guessing
+                # the format per chunk
+                df[col] = self._parse_dates(df[col]).dt.strftime('%Y-%m-%d')
 
         # Replace empty strings with None for cleaner data
         df = df.replace({'': None, 'nan': None, 'NaN': None})
 
         return df
 
-    def _extract_sic_codes(self, row: pd.Series) -> list[str]:
-        """Extract SIC codes from individual columns into a list."""
-        sic_codes = []
-        for i in range(1, 5):
-            col = f'sic_code_{i}'
-            if col in row and pd.notna(row[col]):
-                val = str(row[col])
-                # Extract code before " - " description
-                code = val.split(' - ')[0].strip()
-                if code and code != 'nan':
-                    sic_codes.append(code)
-        return sic_codes
-
-    def _format_ref_date(self, row: pd.Series) -> str | None:
-        """Format Account Ref Day/Month as MM-DD."""
-        try:
-            day = row.get('temp_acc_ref_day')
-            month = row.get('temp_acc_ref_month')
-            
-            if pd.isna(day) or pd.isna(month):
-                return None
-                
-            day_str = str(int(float(day))).zfill(2)
-            month_str = str(int(float(month))).zfill(2)
-            
-            return f"{month_str}-{day_str}"
-        except (ValueError, TypeError):
-            return None
-
-    def _combine_previous_names(self, row: pd.Series) -> str | None:
-        """Combine previous names into a pipe-separated string."""
-        names = []
-        for i in range(1, 11):
-            col = f'temp_prev_name_{i}'
-            if col in row and pd.notna(row[col]) and str(row[col]).strip() != '':
-                names.append(str(row[col]).strip())
-        
-        return "|".join(names) if names else None
+    def _parse_dates(self, values: pd.Series) -> pd.Series:
+        """
+        Parse a date column, coercing unparseable values to NaT.
+
+        Values that are not DATE_FORMAT are retried as ISO_DATE_FORMAT
+        (YYYY-MM-DD), so they are not nulled just for being in the other
+        common layout. Anything else, including ISO datetimes with an offset
+        or a bare year, becomes NaT.
+        """
+        parsed = pd.to_datetime(values, format=self.DATE_FORMAT, errors='coerce')
+        missed = parsed.isna() & values.notna()
+        if missed.any():
+            parsed[missed] = pd.to_datetime(values[missed], format=self.ISO_DATE_FORMAT, errors='coerce')
+        return parsed
+
+    def _extract_sic_codes(self, df: pd.DataFrame) -> pd.Series:
+        """Extract SIC codes from individual columns into a list per row."""
+        # Extract code before " - " description, column-wise
+        code_cols = [
+            df[col].astype('string').str.split(' - ', n=1).str[0].str.strip()
+            for col in self.SIC_COLUMNS
+            if col in df.columns
+        ]
+        if not code_cols:
+            return pd.Series([[] for _ in range(len(df))], index=df.index, dtype=object)
+
+        sic_codes = [
+            [code for code in codes if isinstance(code, str) and code and code != 'nan']
+            for codes in zip(*code_cols)
+        ]
+        return pd.Series(sic_codes, index=df.index, dtype=object)
+
+    def _format_ref_date(self, df: pd.DataFrame) -> pd.Series:
+        """Format Account Ref Day/Month as MM-DD per row."""
+        # Parse both columns in one vectorised pass; unparseable values become NaN
+        days = pd.to_numeric(df['temp_acc_ref_day'], errors='coerce').astype(float)
+        months = pd.to_numeric(df['temp_acc_ref_month'], errors='coerce').astype(float)
+
+        ref_dates = [
+            f"{int(month):02d}-{int(day):02d}" if math.isfinite(day) and math.isfinite(month) else None
+            for day, month in zip(days, months)
+        ]
+        return pd.Series(ref_dates, index=df.index, dtype=object)
+
+    def _combine_previous_names(self, df: pd.DataFrame) -> pd.Series:
+        """Combine previous names into a pipe-separated string per row."""
+        # Strip column-wise, then join the non-empty names of each row
+        name_cols = [
+            df[col].astype('string').str.strip()
+            for col in self.PREVIOUS_NAME_COLUMNS
+            if col in df.columns
+        ]
+        if not name_cols:
+            return pd.Series(None, index=df.index, dtype=object)
+
+        previous_names = [
+            '|'.join(name for name in names if isinstance(name, str) and name) or None
+            for names in zip(*name_cols)
+        ]
+        return pd.Series(previous_names, index=df.index, dtype=object)
@@ -55,7 +55,7 @@ class CompanyLoader(BaseLoader):
                 raise ValueError(f"DataFrame missing required column: {col}")
 
         # Add batch_id
-        df = df.copy()
+        df = df.copy(deep=False)  # new columns only; chunk data is not duplicated
         df['batch_id'] = self.batch_id
         df['last_updated'] = pd.Timestamp.now()
 
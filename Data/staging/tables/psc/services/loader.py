@@ -4,7 +4,6 @@ PSC (Officers) loader service.
 from __future__ import annotations
 
 import sys
-import json
 from io import StringIO
 from pathlib import Path
 from typing import Optional, Any
@@ -17,7 +16,7 @@ DATA_ROOT = Path(__file__).resolve().parents[4]
 if str(DATA_ROOT) not in sys.path:
     sys.path.append(str(DATA_ROOT))
 
-from staging.common.services.base_loader import BaseLoader
+from staging.common.services.base_loader import BaseLoader, dumps_json
 
 class PSCLoader(BaseLoader):
     """
@@ -48,7 +47,7 @@ class PSCLoader(BaseLoader):
         if 'company_number' not in df.columns:
             raise ValueError("DataFrame missing required column: company_number")
 
-        df = df.copy()
+        df = df.copy(deep=False)  # new columns only; chunk data is not duplicated
         df['batch_id'] = self.batch_id
         df['last_updated'] = pd.Timestamp.now()
 
@@ -93,7 +92,7 @@ class PSCLoader(BaseLoader):
 
             # Handle raw_data
             if 'raw_data' in df.columns:
-                 df['raw_data'] = df['raw_data'].apply(lambda x: json.dumps(x) if isinstance(x, dict) else x)
+                 df['raw_data'] = df['raw_data'].apply(lambda x: dumps_json(x) if isinstance(x, dict) else x)
             else:
                  df['raw_data'] = '{}'
 
@@ -0,0 +1,29 @@
+"""
+Tests for CompanyDataParser date handling.
+"""
+import sys
+from pathlib import Path
+
+import pandas as pd
+
+# Add Data root to path
+DATA_ROOT = Path(__file__).resolve().parents[1]
+if str(DATA_ROOT) not in sys.path:
+    sys.path.append(str(DATA_ROOT))
+
+from staging.tables.companies.parsers.company_parser import CompanyDataParser
+
+
+def _parse(values):
+    parser = CompanyDataParser(Path('unused.zip'))
+    parsed = parser._parse_dates(pd.Series(values, dtype=object))
+    return [None if pd.isna(val) else val.strftime('%Y-%m-%d') for val in parsed.tolist()]
+
+
+def test_parse_dates_reads_companies_house_and_iso_dates():
+    assert _parse(['31/12/1999', '2020-01-02', None]) == ['1999-12-31', '2020-01-02', None]
+
+
+def test_parse_dates_nulls_offsets_and_partial_dates():
+    values = ['05/02/2003', '2003-02-05T00:00:00+01:00', '2003', '20030205', 'x']
+    assert _parse(values) == ['2003-02-05', None, None, None, None]